@@ -74,3 +74,51 @@ def save_config(path, content):
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(content, f, ensure_ascii=False, indent=4)
 
+
+
+class LazyConfig:
+    """
+    Configuração JSON carregada do disco apenas no primeiro acesso.
+    Depois de invalidate(), o próximo acesso relê o arquivo sem
+    reescrevê-lo; se o JSON estiver inválido, mantém a versão anterior.
+    """
+
+    def __init__(self, config_path, default_content=None):
+        self.config_path = config_path
+        self.default_content = default_content
+        self._config = None
+        self._stale = False
+
+    def load(self):
+        """
+        Retorna o dicionário de configuração, lendo o arquivo se necessário.
+        """
+        if self._config is None:
+            self._config = load_config(self.config_path, self.default_content)
+            self._stale = False
+        elif self._stale:
+            self._stale = False
+            self._reload()
+        return self._config
+
+    def _reload(self):
+        # O arquivo pode estar no meio de uma edição: nada de
+        # verify_default_config, que recriaria o arquivo com os defaults
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        if not isinstance(config, dict):
+            return
+
+        # Chaves faltantes só em memória, o arquivo do usuário fica intacto
+        merge_defaults(config, self.default_content or {})
+        self._config = config
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def invalidate(self):
+        self._stale = True
@@ -3,10 +3,75 @@
 from pathlib import Path
 import shutil
 import fnmatch
+import re
 import tempfile
 import zipfile
 import urllib.request
 import os
+import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Abaixo disso, o custo do pool supera o ganho da extração paralela
+PARALLEL_EXTRACT_MIN_MEMBERS = 64
+
+
+def _extract_all(zip_ref, zip_source, temp_path):
+    """
+    Extrai todos os membros de zip_ref em temp_path.
+    Se zip_source for um Path e o arquivo for grande, os arquivos são
+    divididos em fatias iguais e extraídos em paralelo (o zlib libera
+    o GIL), cada fatia com o seu próprio ZipFile.
+    """
+
+    # Sem fsync/flush por arquivo: a pasta é temporária e descartável,
+    # então o write-back do sistema operacional basta; sincronizar cada
+    # membro tornaria a extração limitada por syscalls em vez de banda
+    members = zip_ref.infolist()
+    workers = min(os.cpu_count() or 1, len(members))
+
+    # Um arquivo já aberto (download) não pode ser reaberto por worker
+    if (
+        len(members) < PARALLEL_EXTRACT_MIN_MEMBERS
+        or workers < 2
+        or not isinstance(zip_source, Path)
+    ):
+        zip_ref.extractall(temp_path)
+        return
+
+    # Todas as pastas são criadas antes, em série, para que o makedirs
+    # interno do ZipFile.extract não entre em corrida entre workers.
+    # As pastas pai entram como ZipInfo de diretório, assim o ZipFile
+    # aplica a mesma limpeza de nomes que usa ao extrair
+    files = []
+    dirs = {}
+    for member in members:
+        if member.is_dir():
+            dirs.setdefault(member.filename, member)
+            continue
+        files.append(member.filename)
+        parent = member.filename.rpartition("/")[0]
+        if parent:
+            dirs.setdefault(parent + "/", zipfile.ZipInfo(parent + "/"))
+
+    for member in dirs.values():
+        zip_ref.extract(member, temp_path)
+
+    # O ZipFile não é seguro para leitura concorrente (contagem de
+    # referências do arquivo sem lock), então cada fatia abre o seu
+    def extract_chunk(names):
+        with zipfile.ZipFile(zip_source, "r") as chunk_ref:
+            for name in names:
+                chunk_ref.extract(name, temp_path)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(extract_chunk, files[i::workers])
+            for i in range(workers)
+        ]
+        for future in futures:
+            future.result()
 
 
 def extract_zip_to_temp(source: str) -> Path | None:
@@ -19,29 +84,38 @@ def extract_zip_to_temp(source: str) -> Path | None:
 
     try:
         # Cria diretório temporário persistente
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = tempfile.mkdtemp(prefix="sprojgen_")
         temp_path = Path(temp_dir)
 
         # Determinar se é URL
         if source.startswith(("http://", "https://")):
-            zip_path = temp_path / "downloaded.zip"
-            urllib.request.urlretrieve(source, zip_path)
+            # Baixa para memória (ou disco, acima de 64 MiB) sem gravar
+            # um .zip intermediário na pasta temporária. Antes do Python
+            # 3.11 o SpooledTemporaryFile não tem seekable(), que o
+            # ZipFile exige; nesse caso usa um TemporaryFile anônimo
+            if sys.version_info >= (3, 11):
+                zip_source = tempfile.SpooledTemporaryFile(max_size=64 << 20)
+            else:
+                zip_source = tempfile.TemporaryFile()
+            with urllib.request.urlopen(source) as response:
+                shutil.copyfileobj(response, zip_source)
+            zip_source.seek(0)
         else:
-            zip_path = Path(source)
-            if not zip_path.exists():
+            zip_source = Path(source)
+            if not zip_source.exists():
                 return None
 
-        # Validar se é zip válido
-        if not zipfile.is_zipfile(zip_path):
-            return None
+        try:
+            # Extrair (ZipFile já valida o arquivo ao ler o diretório central)
+            with zipfile.ZipFile(zip_source, "r") as zip_ref:
+                _extract_all(zip_ref, zip_source, temp_path)
 
-        # Extrair
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(temp_path)
+        except zipfile.BadZipFile:
+            return None
 
-        # Se baixou da internet, remove zip baixado
-        if source.startswith(("http://", "https://")):
-            zip_path.unlink(missing_ok=True)
+        finally:
+            if not isinstance(zip_source, Path):
+                zip_source.close()
 
         return temp_path
 
@@ -49,6 +123,97 @@ def extract_zip_to_temp(source: str) -> Path | None:
         return None
 
 
+def _copy_file(src, dst):
+    """
+    Copia src para dst como shutil.copy2, mas no Linux os bytes
+    são movidos dentro do kernel com os.copy_file_range.
+    """
+
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # Alguns sistemas de arquivos devolvem 0 em vez de
+                    # recusar a chamada; o copy2 refaz a cópia inteira
+                    raise OSError("copy_file_range copied nothing")
+                remaining -= copied
+
+    except OSError:
+        # Kernel ou sistema de arquivos sem suporte: caminho padrão
+        shutil.copy2(src, dst)
+        return
+
+    # Mesmos metadados que o copy2 preserva (modo, datas)
+    shutil.copystat(src, dst)
+
+
+def _build_rewriter(replacements: dict):
+    """
+    Compila todas as chaves de replacements em uma única regex de
+    alternação e retorna uma função que substitui todas elas em uma só
+    passada. As chaves podem ser str ou bytes. Se nada for substituído,
+    a função devolve o próprio objeto recebido.
+    """
+
+    if not replacements:
+        return lambda text: text
+
+    # Chaves mais longas primeiro: se uma chave for prefixo de outra,
+    # a alternação casa a maior
+    keys = sorted(replacements, key=len, reverse=True)
+
+    separator = b"|" if isinstance(keys[0], bytes) else "|"
+    pattern = re.compile(separator.join(re.escape(key) for key in keys))
+
+    def repl(match):
+        return replacements[match.group(0)]
+
+    def rewrite(text):
+        new_text, count = pattern.subn(repl, text)
+        return new_text if count else text
+
+    return rewrite
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_rewriter(items: tuple):
+    """
+    Versão memoizada de _build_rewriter, indexada pelos pares
+    (chave, valor) ordenados. Gerar de novo com os mesmos campos
+    reaproveita a regex já compilada.
+    """
+    return _build_rewriter(dict(items))
+
+
+def _build_name_matcher(patterns):
+    """
+    Compila os padrões glob (tipo ["*.py", "*.md"]) uma única vez e
+    retorna uma função que diz se um nome de arquivo casa com algum deles.
+    """
+
+    patterns = [os.path.normcase(pattern) for pattern in patterns]
+
+    if not patterns:
+        return lambda name: False
+
+    # Caso comum: só sufixos literais, basta um endswith com tupla
+    if all(
+        pattern.startswith("*") and not any(c in pattern[1:] for c in "*?[")
+        for pattern in patterns
+    ):
+        suffixes = tuple(pattern[1:] for pattern in patterns)
+        return lambda name: os.path.normcase(name).endswith(suffixes)
+
+    regex = re.compile("|".join(fnmatch.translate(p) for p in patterns))
+    return lambda name: regex.match(os.path.normcase(name)) is not None
+
+
 def generate_project(
     template_dir: str,
     output_dir: str,
@@ -74,6 +239,22 @@ def generate_project(
     if not template_path.exists():
         raise FileNotFoundError("Template directory not found")
 
+    # Tudo o que não depende do arquivo é preparado uma única vez,
+    # antes de apagar a saída antiga e de percorrer o template
+    replacements_b = {
+        key.encode("utf-8"): value.encode("utf-8")
+        for key, value in replacements.items()
+    }
+
+    # A pasta src/__MODULE_NAME__ já é criada com o nome final
+    path_replacements = dict(replacements)
+    if "{MODULE_NAME}" in replacements:
+        path_replacements["__MODULE_NAME__"] = replacements["{MODULE_NAME}"]
+
+    rewrite = _cached_rewriter(tuple(sorted(path_replacements.items())))
+    rewrite_bytes = _cached_rewriter(tuple(sorted(replacements_b.items())))
+    should_replace = _build_name_matcher(replace_extensions)
+
     # 🔥 CORREÇÃO DO OVERWRITE
     if output_path.exists():
         if overwrite:
@@ -81,48 +262,65 @@ def generate_project(
         else:
             raise FileExistsError("Output directory already exists")
 
-    for item in template_path.rglob("*"):
+    # Cache dos segmentos de caminho já reescritos (pastas se repetem muito)
+    seg_cache = {}
 
-        relative_path = item.relative_to(template_path)
+    def rewrite_segment(part):
+        new_part = seg_cache.get(part)
+        if new_part is None:
+            new_part = seg_cache[part] = rewrite(part)
+        return new_part
 
-        # Substituir palavras também no nome do arquivo/pasta
-        new_relative_str = str(relative_path)
-        for key, value in replacements.items():
-            new_relative_str = new_relative_str.replace(key, value)
+    def rewrite_path(relative_path):
+        return Path(*map(rewrite_segment, relative_path.parts))
 
-        new_path = output_path / new_relative_str
+    def process_file(item, new_path, replace):
 
-        if item.is_dir():
-            new_path.mkdir(parents=True, exist_ok=True)
-            continue
-
-        new_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Verifica se deve substituir conteúdo
-        should_replace = any(
-            fnmatch.fnmatch(item.name, pattern)
-            for pattern in replace_extensions
-        )
+        if replace:
+            content = item.read_bytes()
+            new_content = rewrite_bytes(content)
 
-        if should_replace:
-            content = item.read_text(encoding="utf-8")
+            new_path.write_bytes(new_content)
 
-            for key, value in replacements.items():
-                content = content.replace(key, value)
-
-            new_path.write_text(content, encoding="utf-8")
+            # Sem nenhum placeholder: os bytes já lidos são gravados como
+            # estão, com os mesmos metadados de uma cópia
+            if new_content is content:
+                shutil.copystat(item, new_path)
 
         else:
-            shutil.copy2(item, new_path)
-
-    # 🔥 CORREÇÃO DO RENAME
-    old_path = output_path / "src" / "__MODULE_NAME__"
-    new_path = output_path / "src" / replacements["{MODULE_NAME}"]
-
-    if old_path.exists():
-        if new_path.exists():
-            shutil.rmtree(new_path)
-        old_path.rename(new_path)
+            _copy_file(item, new_path)
+
+    # 1ª passada: cria as pastas e calcula o destino de cada arquivo
+    files = []
+
+    for dirpath, dirnames, filenames in os.walk(template_path):
+
+        relative_dir = Path(os.path.relpath(dirpath, template_path))
+
+        # Substituir palavras também no nome das pastas e arquivos
+        new_dir = output_path / rewrite_path(relative_dir)
+        new_dir.mkdir(parents=True, exist_ok=True)
+
+        for filename in filenames:
+            files.append((
+                Path(dirpath, filename),
+                new_dir / rewrite_segment(filename),
+                # Verifica se deve substituir conteúdo
+                should_replace(filename)
+            ))
+
+    # 2ª passada: cada arquivo é independente, então o I/O é sobreposto.
+    # As threads passam a maior parte do tempo bloqueadas em read/write
+    # (GIL liberado), por isso mais workers que núcleos
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(process_file, *entry)
+            for entry in files
+        ]
+        for future in futures:
+            future.result()
 
     print(f"Projeto gerado em: {output_path}")
 
@@ -1,8 +1,10 @@
 import sys
 import os
+import functools
 
 # self.icon_path = resource_path("icons", "logo.png")
 
+@functools.lru_cache(maxsize=None)
 def resource_path(*parts):
     if hasattr(sys, "_MEIPASS"):
         base = sys._MEIPASS
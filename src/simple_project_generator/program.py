@@ -2,16 +2,17 @@
 
 import os
 import sys
-import signal
-import json
-import shutil
+import functools
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QSizePolicy, QAction,
     QFormLayout, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, 
     QFileDialog, QMessageBox, QComboBox, QLabel
 )
-from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtCore import (
+    Qt, QUrl, QObject, QRunnable, QThreadPool, QSettings, QFileSystemWatcher,
+    pyqtSignal
+)
 from PyQt5.QtGui import QIcon, QDesktopServices
 
 import simple_project_generator.about as about
@@ -19,16 +20,6 @@ import simple_project_generator.modules.configure as configure
 from simple_project_generator.modules.resources import resource_path
 
 from simple_project_generator.modules.wabout import show_about_window
-from simple_project_generator.desktop import (
-    create_desktop_file,
-    create_desktop_directory,
-    create_desktop_menu
-)
-
-from simple_project_generator.modules.project_generator import (
-    extract_zip_to_temp,
-    generate_project
-)
 
 # ---------- Path to project file ----------
 DEFAULT_PROJECT_PATH = os.path.join(
@@ -178,8 +169,73 @@ DEFAULT_CONTENT = {
     "window_height": 600
 }
 
-configure.verify_default_config(CONFIG_PATH, default_content=DEFAULT_CONTENT)
-CONFIG = configure.load_config(CONFIG_PATH)
+CONFIG = configure.LazyConfig(CONFIG_PATH, default_content=DEFAULT_CONTENT)
+
+# ---------- Stamp of desktop entries already created ----------
+DESKTOP_STAMP_PATH = os.path.join(
+    os.path.expanduser("~"),
+    ".local",
+    "share",
+    "applications",
+    f".{about.__package__}.v{about.__version__}.stamp"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _icon(name):
+    """Shared QIcon for a file in the icons directory"""
+    return QIcon(resource_path("icons", name))
+
+
+# ============================================================
+# GENERATE WORKER
+# ============================================================
+
+class WorkerSignals(QObject):
+    # (status, error text); messages are looked up on the GUI thread
+    finished = pyqtSignal(str, str)
+
+
+class GenerateWorker(QRunnable):
+    """Extracts the template and generates the project off the GUI thread"""
+
+    SUCCESS = "success"
+    EXTRACT_ERROR = "extract_error"
+    ERROR = "error"
+
+    def __init__(self, extract_template, template_path, output_dir, replacements):
+        super().__init__()
+        self.signals = WorkerSignals()
+
+        self.extract_template = extract_template
+        self.template_path = template_path
+        self.output_dir = output_dir
+        self.replacements = replacements
+
+    def run(self):
+        # finished is always emitted, so the window never stays busy
+        try:
+            from simple_project_generator.modules.project_generator import generate_project
+
+            temp_path = self.extract_template(self.template_path)
+
+            if not temp_path:
+                self.signals.finished.emit(self.EXTRACT_ERROR, "")
+                return
+
+            generate_project(
+                template_dir=temp_path,
+                output_dir=self.output_dir,
+                replacements=self.replacements,
+                replace_extensions=["*.py", "*.md", "*.sh"],
+                overwrite=True
+            )
+
+        except Exception as e:
+            self.signals.finished.emit(self.ERROR, str(e))
+            return
+
+        self.signals.finished.emit(self.SUCCESS, "")
 
 
 # ============================================================
@@ -188,6 +244,13 @@ CONFIG = configure.load_config(CONFIG_PATH)
 
 class MainWindow(QMainWindow):
 
+    # Template name -> resource path parts, resolved only when generating
+    template_specs = {
+        "GUI pyqt5 template 1": ("data", "pyqt5_project_template_1.zip"),
+        "CMD desktop 1": ("data", "cmd_project_desktop_1.zip"),
+        "CMD simple 1": ("data", "cmd_project_simple_1.zip")
+    }
+
     def __init__(self):
         super().__init__()
 
@@ -195,35 +258,48 @@ class MainWindow(QMainWindow):
         self.resize(CONFIG["window_width"], CONFIG["window_height"])
 
         self.icon_path = resource_path("icons", "logo.png")
-        self.setWindowIcon(QIcon(self.icon_path))
+        self.setWindowIcon(_icon("logo.png"))
 
-        self.template_map = {
-            "GUI pyqt5 template 1": resource_path("data", "pyqt5_project_template_1.zip"),
-            "CMD desktop 1": resource_path("data", "cmd_project_desktop_1.zip"),
-            "CMD simple 1": resource_path("data", "cmd_project_simple_1.zip")
-        }
+        # Extracted templates reused across clicks: {zip path: (stamp, dir)}
+        self._template_cache = {}
+        self._generate_worker = None
 
         self._create_toolbar()
         self._generate_ui()
+        self.restore_session()
+
+        # Reload the window config whenever the user saves it. The folder
+        # is watched too, since editors that save by replacing the file
+        # drop it from the watcher.
+        self.config_watcher = QFileSystemWatcher(
+            [CONFIG_PATH, os.path.dirname(CONFIG_PATH)],
+            self
+        )
+        self.config_watcher.fileChanged.connect(self.on_config_file_changed)
+        self.config_watcher.directoryChanged.connect(self.on_config_file_changed)
 
     # ============================================================
     # UI
     # ============================================================
 
     def _generate_ui(self):
+        cfg = CONFIG.load()
 
         central_widget = QWidget()
+        # Build the whole form before the first layout/paint pass
+        central_widget.setUpdatesEnabled(False)
+
         layout = QVBoxLayout()
         form_layout = QFormLayout()
+        form_layout.setRowWrapPolicy(QFormLayout.DontWrapRows)
 
         # ---------------- Template selector ----------------
         self.template_selector = QComboBox()
-        for keyname in self.template_map:
-            self.template_selector.addItem(keyname)
+        self.template_selector.addItems(list(self.template_specs))
 
-        self.template_selector.setToolTip(CONFIG["tooltip_template_selector"])
+        self.template_selector.setToolTip(cfg["tooltip_template_selector"])
 
-        form_layout.addRow(CONFIG["label_template"], self.template_selector)
+        form_layout.addRow(cfg["label_template"], self.template_selector)
 
         # ---------------- Output directory ----------------
         output_widget = QWidget()
@@ -231,13 +307,13 @@ class MainWindow(QMainWindow):
         output_layout.setContentsMargins(0, 0, 0, 0)
 
         self.output_dir_input = QLineEdit()
-        self.output_dir_input.setPlaceholderText(CONFIG["placeholder_output_dir"])
-        self.output_dir_input.setToolTip(CONFIG["tooltip_output_dir_input"])
+        self.output_dir_input.setPlaceholderText(cfg["placeholder_output_dir"])
+        self.output_dir_input.setToolTip(cfg["tooltip_output_dir_input"])
 
-        self.output_browse_button = QPushButton(CONFIG["button_browse"])
-        self.output_browse_button.setIcon(QIcon(resource_path("icons", "folder-open.png")))
+        self.output_browse_button = QPushButton(cfg["button_browse"])
+        self.output_browse_button.setIcon(_icon("folder-open.png"))
         self.output_browse_button.setFixedWidth(110)
-        self.output_browse_button.setToolTip(CONFIG["button_browse_tooltip"])
+        self.output_browse_button.setToolTip(cfg["button_browse_tooltip"])
         self.output_browse_button.clicked.connect(self.select_output_directory)
 
         output_layout.addWidget(self.output_dir_input)
@@ -245,14 +321,14 @@ class MainWindow(QMainWindow):
 
         output_widget.setLayout(output_layout)
 
-        form_layout.addRow(CONFIG["label_output_dir"], output_widget)
+        form_layout.addRow(cfg["label_output_dir"], output_widget)
         
         form_layout.addRow(" ", None)
 
         # ---------------- Dynamic fields ----------------
         self.fields = {}
 
-        for key, field_data in CONFIG["fields"].items():
+        for key, field_data in cfg["fields"].items():
 
             line = QLineEdit()
             line.setPlaceholderText(field_data["placeholder"])
@@ -262,8 +338,8 @@ class MainWindow(QMainWindow):
             self.fields[key] = line
 
         # ---------------- Generate button ----------------
-        self.generate_button = QPushButton(CONFIG["button_generate"])
-        self.generate_button.setToolTip(CONFIG["button_generate_tooltip"])
+        self.generate_button = QPushButton(cfg["button_generate"])
+        self.generate_button.setToolTip(cfg["button_generate_tooltip"])
         self.generate_button.clicked.connect(self.on_generate_clicked)
 
         layout.addLayout(form_layout)
@@ -272,42 +348,45 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
 
+        central_widget.setUpdatesEnabled(True)
+
     # ============================================================
     # Toolbar
     # ============================================================
 
     def _create_toolbar(self):
+        cfg = CONFIG.load()
 
         self.toolbar = self.addToolBar("Main")
         self.toolbar.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
 
         # ---------------- Save ----------------
         self.save_action = QAction(
-            QIcon(resource_path("icons", "download-green.png")),
-            CONFIG["toolbar_save"],
+            _icon("download-green.png"),
+            cfg["toolbar_save"],
             self
         )
-        self.save_action.setToolTip(CONFIG["toolbar_save_tooltip"])
+        self.save_action.setToolTip(cfg["toolbar_save_tooltip"])
         self.save_action.triggered.connect(self.save_config_json)
         self.toolbar.addAction(self.save_action)
 
         # ---------------- Load ----------------
         self.load_action = QAction(
-            QIcon(resource_path("icons", "document-open.png")),
-            CONFIG["toolbar_load"],
+            _icon("document-open.png"),
+            cfg["toolbar_load"],
             self
         )
-        self.load_action.setToolTip(CONFIG["toolbar_load_tooltip"])
+        self.load_action.setToolTip(cfg["toolbar_load_tooltip"])
         self.load_action.triggered.connect(self.load_config_json)
         self.toolbar.addAction(self.load_action)
 
         # ---------------- Load template ----------------
         self.load_default_action = QAction(
-            QIcon(resource_path("icons", "document-open.png")),
-            CONFIG["toolbar_load_default"],
+            _icon("document-open.png"),
+            cfg["toolbar_load_default"],
             self
         )
-        self.load_default_action.setToolTip(CONFIG["toolbar_load_default_tooltip"])
+        self.load_default_action.setToolTip(cfg["toolbar_load_default_tooltip"])
         self.load_default_action.triggered.connect(self.load_default_config_json)
         self.toolbar.addAction(self.load_default_action)
 
@@ -319,41 +398,41 @@ class MainWindow(QMainWindow):
 
         # ---------------- edit template ----------------
         self.edit_default_action = QAction(
-            QIcon(resource_path("icons", "text-configure.png")),
-            CONFIG["toolbar_edit_default"],
+            _icon("text-configure.png"),
+            cfg["toolbar_edit_default"],
             self
         )
-        self.edit_default_action.setToolTip(CONFIG["toolbar_edit_default_tooltip"])
+        self.edit_default_action.setToolTip(cfg["toolbar_edit_default_tooltip"])
         self.edit_default_action.triggered.connect(self.open_default_json)
         self.toolbar.addAction(self.edit_default_action)
 
         # ---------------- Configure ----------------
         configure_action = QAction(
-            QIcon(resource_path("icons", "text-configure.png")),
-            CONFIG["toolbar_configure"],
+            _icon("text-configure.png"),
+            cfg["toolbar_configure"],
             self
         )
-        configure_action.setToolTip(CONFIG["toolbar_configure_tooltip"])
+        configure_action.setToolTip(cfg["toolbar_configure_tooltip"])
         configure_action.triggered.connect(self.open_configure_editor)
         self.toolbar.addAction(configure_action)
 
         # ---------------- About ----------------
         about_action = QAction(
-            QIcon(resource_path("icons", "status_help.png")),
-            CONFIG["toolbar_about"],
+            _icon("status_help.png"),
+            cfg["toolbar_about"],
             self
         )
-        about_action.setToolTip(CONFIG["toolbar_about_tooltip"])
+        about_action.setToolTip(cfg["toolbar_about_tooltip"])
         about_action.triggered.connect(self.open_about)
         self.toolbar.addAction(about_action)
 
         # ---------------- Coffee ----------------
         coffee_action = QAction(
-            QIcon(resource_path("icons", "emote-love.png")),
-            CONFIG["toolbar_coffee"],
+            _icon("emote-love.png"),
+            cfg["toolbar_coffee"],
             self
         )
-        coffee_action.setToolTip(CONFIG["toolbar_coffee_tooltip"])
+        coffee_action.setToolTip(cfg["toolbar_coffee_tooltip"])
         coffee_action.triggered.connect(self.on_coffee_action_click)
         self.toolbar.addAction(coffee_action)
 
@@ -364,7 +443,9 @@ class MainWindow(QMainWindow):
     def select_output_directory(self):
         directory = QFileDialog.getExistingDirectory(
             self,
-            CONFIG["label_output_dir"]
+            CONFIG["label_output_dir"],
+            "",
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
         )
         if directory:
             self.output_dir_input.setText(directory)
@@ -373,17 +454,61 @@ class MainWindow(QMainWindow):
     # Generator
     # ============================================================
 
+    def _resolve_template(self, name):
+        spec = self.template_specs.get(name)
+        if spec is None:
+            return None
+        return resource_path(*spec)
+
+    def _extract_template(self, template_path):
+        import shutil
+        import threading
+        from simple_project_generator.modules.project_generator import extract_zip_to_temp
+
+        try:
+            st = os.stat(template_path)
+        except OSError:
+            return None
+
+        # The zip is extracted again only if it changed on disk
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._template_cache.pop(template_path, None)
+
+        if cached is not None:
+            cached_stamp, temp_path = cached
+            if cached_stamp == stamp and temp_path.is_dir():
+                self._template_cache[template_path] = cached
+                return temp_path
+
+            # Nothing reads the stale extraction anymore: delete it in the
+            # background instead of delaying the new one
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(temp_path,),
+                kwargs={"ignore_errors": True},
+                daemon=True
+            ).start()
+
+        temp_path = extract_zip_to_temp(template_path)
+
+        if temp_path:
+            self._template_cache[template_path] = (stamp, temp_path)
+
+        return temp_path
+
     def on_generate_clicked(self):
 
         selected_template = self.template_selector.currentText()
-        template_path = self.template_map.get(selected_template)
+        template_path = self._resolve_template(selected_template)
 
         if not template_path:
             QMessageBox.warning(self, "Error", CONFIG["msg_invalid_template"])
             return
 
         # ---------------- Clean + Validate fields ----------------
-        replacements = {}
+        fields_cfg = CONFIG["fields"]
+        # Same keys as self.fields, so the loop below never grows the dict
+        replacements = dict.fromkeys(self.fields)
         empty_fields = []
 
         for key, field in self.fields.items():
@@ -398,12 +523,12 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(
                         self,
                         "Invalid URL",
-                        f"{CONFIG['fields'][key]['label']} must start with http:// or https://"
+                        f"{fields_cfg[key]['label']} must start with http:// or https://"
                     )
                     return
 
             if not value:
-                empty_fields.append(CONFIG["fields"][key]["label"])
+                empty_fields.append(fields_cfg[key]["label"])
 
             replacements[key] = value
 
@@ -439,34 +564,37 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-        # ---------------- Extract template ----------------
-        temp_path = extract_zip_to_temp(template_path)
+        # ---------------- Generate (background) ----------------
+        self._generate_worker = GenerateWorker(
+            self._extract_template,
+            template_path,
+            output_dir,
+            replacements
+        )
+        self._generate_worker.signals.finished.connect(self.on_generate_finished)
 
-        if not temp_path:
-            QMessageBox.critical(self, "Error", CONFIG["msg_extract_error"])
-            return
+        self.generate_button.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
 
-        try:
-            generate_project(
-                template_dir=temp_path,
-                output_dir=output_dir,
-                replacements=replacements,
-                replace_extensions=["*.py", "*.md", "*.sh"],
-                overwrite=True
-            )
-
-            QMessageBox.information(self, "Success", CONFIG["msg_success"])
+        QThreadPool.globalInstance().start(self._generate_worker)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+    def on_generate_finished(self, status, error):
+        self._generate_worker = None
 
-        finally:
-            shutil.rmtree(temp_path, ignore_errors=True)
+        QApplication.restoreOverrideCursor()
+        self.generate_button.setEnabled(True)
 
+        if status == GenerateWorker.SUCCESS:
+            QMessageBox.information(self, "Success", CONFIG["msg_success"])
+        elif status == GenerateWorker.EXTRACT_ERROR:
+            QMessageBox.critical(self, "Error", CONFIG["msg_extract_error"])
+        else:
+            QMessageBox.critical(self, "Error", error)
 
     # ---------------- Save / Load ----------------
 
     def save_config_json(self):
+        import json
 
         path, _ = QFileDialog.getSaveFileName(
             self,
@@ -490,10 +618,14 @@ class MainWindow(QMainWindow):
             }
         }
 
+        # Serialize in memory and write once; json.dump with indent
+        # issues one write() per token
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+            f.write(json.dumps(data, indent=4))
 
     def _load_from_path(self, path):
+        import json
+
         if not path:
             return
         
@@ -534,6 +666,33 @@ class MainWindow(QMainWindow):
 
         self._load_from_path(DEFAULT_PROJECT_PATH)
 
+    # ---------------- Session (QSettings) ----------------
+
+    def _session_settings(self):
+        return QSettings(about.__package__, "session")
+
+    def restore_session(self):
+        # The output directory is not restored on purpose: Generate
+        # replaces it, so it must always be chosen explicitly
+        settings = self._session_settings()
+
+        template_name = settings.value("template", "", type=str)
+        index = self.template_selector.findText(template_name, Qt.MatchExactly)
+
+        if index >= 0:
+            self.template_selector.setCurrentIndex(index)
+
+        for key, field in self.fields.items():
+            field.setText(settings.value(f"fields/{key}", "", type=str))
+
+    def save_session(self):
+        settings = self._session_settings()
+
+        settings.setValue("template", self.template_selector.currentText())
+
+        for key, field in self.fields.items():
+            settings.setValue(f"fields/{key}", field.text())
+
     # ============================================================
     # Misc
     # ============================================================
@@ -542,13 +701,19 @@ class MainWindow(QMainWindow):
         if os.name == 'nt':
             os.startfile(CONFIG_PATH)
         else:
-            os.system(f'xdg-open "{CONFIG_PATH}"')
+            QDesktopServices.openUrl(QUrl.fromLocalFile(CONFIG_PATH))
+
+    def on_config_file_changed(self, path):
+        CONFIG.invalidate()
+
+        if CONFIG_PATH not in self.config_watcher.files() and os.path.exists(CONFIG_PATH):
+            self.config_watcher.addPath(CONFIG_PATH)
 
     def open_default_json(self):
         if os.name == 'nt':
             os.startfile(DEFAULT_PROJECT_PATH)
         else:
-            os.system(f'xdg-open "{DEFAULT_PROJECT_PATH}"')
+            QDesktopServices.openUrl(QUrl.fromLocalFile(DEFAULT_PROJECT_PATH))
 
     def open_about(self):
         data = {
@@ -568,39 +733,72 @@ class MainWindow(QMainWindow):
     def on_coffee_action_click(self):
         QDesktopServices.openUrl(QUrl("https://ko-fi.com/trucomanx"))
 
+    def closeEvent(self, event):
+        import shutil
+
+        self.save_session()
+
+        # A running generation may still be reading the cached templates
+        QThreadPool.globalInstance().waitForDone()
+
+        for _, temp_path in self._template_cache.values():
+            shutil.rmtree(temp_path, ignore_errors=True)
+        self._template_cache.clear()
+
+        super().closeEvent(event)
+
 
 # ============================================================
 # Main
 # ============================================================
 
+def touch_desktop_stamp():
+    os.makedirs(os.path.dirname(DESKTOP_STAMP_PATH), exist_ok=True)
+    with open(DESKTOP_STAMP_PATH, "a"):
+        pass
+
 def main():
+    import signal
+    from simple_project_generator.desktop import (
+        create_desktop_file,
+        create_desktop_directory,
+        create_desktop_menu
+    )
+
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     extras=""
 
-    create_desktop_directory()    
-    create_desktop_menu()
-    create_desktop_file(os.path.join("~",".local","share","applications"), 
-                        program_name=about.__program_name__,
-                        extras=extras)
+    # Desktop entries are checked once per installed version
+    if not os.path.exists(DESKTOP_STAMP_PATH):
+        create_desktop_directory()    
+        create_desktop_menu()
+        create_desktop_file(os.path.join("~",".local","share","applications"), 
+                            program_name=about.__program_name__,
+                            extras=extras)
+        touch_desktop_stamp()
     
-    for n in range(len(sys.argv)):
-        if sys.argv[n] == "--autostart":
-            create_desktop_directory(overwrite = True)
-            create_desktop_menu(overwrite = True)
-            create_desktop_file(os.path.join("~",".config","autostart"), 
-                                overwrite=True, 
-                                program_name=about.__program_name__,
-                                extras=extras)
-            return
-        if sys.argv[n] == "--applications":
-            create_desktop_directory(overwrite = True)
-            create_desktop_menu(overwrite = True)
-            create_desktop_file(os.path.join("~",".local","share","applications"), 
-                                overwrite=True, 
-                                program_name=about.__program_name__,
-                                extras=extras)
-            return
+    args = set(sys.argv[1:])
+
+    if "--autostart" in args:
+        create_desktop_directory(overwrite = True)
+        create_desktop_menu(overwrite = True)
+        create_desktop_file(os.path.join("~",".config","autostart"), 
+                            overwrite=True, 
+                            program_name=about.__program_name__,
+                            extras=extras)
+        touch_desktop_stamp()
+        return
+
+    if "--applications" in args:
+        create_desktop_directory(overwrite = True)
+        create_desktop_menu(overwrite = True)
+        create_desktop_file(os.path.join("~",".local","share","applications"), 
+                            overwrite=True, 
+                            program_name=about.__program_name__,
+                            extras=extras)
+        touch_desktop_stamp()
+        return
     
     app = QApplication(sys.argv)
     app.setApplicationName(about.__package__)